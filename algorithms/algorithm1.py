@@ -1,11 +1,32 @@
 """Algorithm 1: Simple LLM-only verification."""
-from config.claude_client import send_message
+import asyncio
+from config.claude_client import send_message, stream_message
+from config.settings import LLM_REQUEST_COALESCING, LLM_STREAMING, LLM_EXPLANATIONS
+from utils.singleflight import llm_flight, verification_key
+from utils.verdict_stream import StreamedVerdict
 
 
 def verify_name_algorithm1(latest_name, user_input):
     """
     Algorithm 1: A simple LLM-only verification prompt.
+    Concurrent identical requests share a single LLM call.
     """
+    if not LLM_REQUEST_COALESCING:
+        return _request_verification(latest_name, user_input)
+    key = verification_key(latest_name, user_input, 1)
+    return llm_flight.do(key, _request_verification, latest_name, user_input)
+
+
+async def verify_name_algorithm1_async(latest_name, user_input):
+    """Asyncio variant of verify_name_algorithm1. The LLM call runs in the default executor."""
+    if not LLM_REQUEST_COALESCING:
+        return await asyncio.to_thread(_request_verification, latest_name, user_input)
+    key = verification_key(latest_name, user_input, 1)
+    return await llm_flight.do_async(key, _request_verification, latest_name, user_input)
+
+
+def _request_verification(latest_name, user_input):
+    """Builds the Algorithm 1 prompt and calls the LLM."""
     full_prompt = f"""
         Verify whether these two names are considered a match.
 
@@ -19,6 +40,12 @@ def verify_name_algorithm1(latest_name, user_input):
         "explanation": "short explanation"
         }}
         """
+    if LLM_STREAMING:
+        verdict = StreamedVerdict(stream_message(full_prompt))
+        if not LLM_EXPLANATIONS:
+            verdict.close()
+        return verdict.to_json()
+
     message = send_message(full_prompt)
     return message.content[0].text
 
@@ -1,12 +1,56 @@
 """Algorithm 2: Advanced LLM verification with context and rules."""
-from config.claude_client import send_message
+import asyncio
+from config.claude_client import send_message, stream_message
+from config.settings import LLM_REQUEST_COALESCING, LLM_STREAMING, LLM_EXPLANATIONS
+from utils.singleflight import llm_flight, verification_key
+from utils.verdict_stream import StreamedVerdict
 
 
 def verify_name_algorithm2(latest_name, user_input, phonetic_hint=False):
     """
     Algorithm 2: A more sophisticated verification prompt with added context and rules.
     - phonetic_hint: Provides extra context if a risky phonetic match was detected.
+    Concurrent identical requests share a single LLM call.
     """
+    if not LLM_REQUEST_COALESCING:
+        return _request_verification(latest_name, user_input, phonetic_hint)
+    key = verification_key(latest_name, user_input, 2, phonetic_hint)
+    return llm_flight.do(key, _request_verification, latest_name, user_input, phonetic_hint)
+
+
+async def verify_name_algorithm2_async(latest_name, user_input, phonetic_hint=False):
+    """Asyncio variant of verify_name_algorithm2. The LLM call runs in the default executor."""
+    if not LLM_REQUEST_COALESCING:
+        return await asyncio.to_thread(_request_verification, latest_name, user_input, phonetic_hint)
+    key = verification_key(latest_name, user_input, 2, phonetic_hint)
+    return await llm_flight.do_async(key, _request_verification, latest_name, user_input, phonetic_hint)
+
+
+def verify_name_algorithm2_streamed(latest_name, user_input, phonetic_hint=False):
+    """
+    Streaming variant of verify_name_algorithm2.
+    Returns a StreamedVerdict as soon as "match" and "confidence" are decoded; its
+    explanation is read on first access, or skipped entirely by calling close().
+    Not coalesced: each caller owns its verdict and the stream behind it.
+    """
+    return StreamedVerdict(stream_message(_build_prompt(latest_name, user_input, phonetic_hint)))
+
+
+def _request_verification(latest_name, user_input, phonetic_hint):
+    """Calls the LLM with the Algorithm 2 prompt and returns the JSON verdict."""
+    full_prompt = _build_prompt(latest_name, user_input, phonetic_hint)
+    if LLM_STREAMING:
+        verdict = StreamedVerdict(stream_message(full_prompt))
+        if not LLM_EXPLANATIONS:
+            verdict.close()
+        return verdict.to_json()
+
+    message = send_message(full_prompt)
+    return message.content[0].text
+
+
+def _build_prompt(latest_name, user_input, phonetic_hint):
+    """Builds the Algorithm 2 prompt."""
     base_prompt = f"""
     You are a financial identity verification expert.
     Analyze if these two names refer to the same person.
@@ -44,7 +88,5 @@ def verify_name_algorithm2(latest_name, user_input, phonetic_hint=False):
     "explanation": "short reason"
     }}
     """
-
-    message = send_message(full_prompt)
-    return message.content[0].text
+    return full_prompt
 
@@ -2,29 +2,79 @@
 import anthropic
 from config.settings import ANTHROPIC_API_KEY, CLAUDE_MODEL
 
-# Validate API key before initializing client
-if not ANTHROPIC_API_KEY:
-    raise ValueError(
-        "ANTHROPIC_API_KEY is not set. Please set it in your .env file or environment variables."
-    )
+# Anthropic Claude client, created on first use
+client = None
+
+# Optional replacement for the Claude API (e.g., a local stand-in for load tests)
+_message_backend = None
+
+
+def get_client():
+    """Validates the configuration and returns the shared Anthropic client."""
+    global client
+    if client is not None:
+        return client
 
-if not CLAUDE_MODEL:
-    raise ValueError(
-        "CLAUDE_MODEL is not set. Please set it in your .env file or environment variables."
+    # Validate API key before initializing client
+    if not ANTHROPIC_API_KEY:
+        raise ValueError(
+            "ANTHROPIC_API_KEY is not set. Please set it in your .env file or environment variables."
+        )
+
+    if not CLAUDE_MODEL:
+        raise ValueError(
+            "CLAUDE_MODEL is not set. Please set it in your .env file or environment variables."
+        )
+
+    client = anthropic.Anthropic(
+        api_key=ANTHROPIC_API_KEY
     )
+    return client
+
 
-# Initialize Anthropic Claude client
-client = anthropic.Anthropic(
-    api_key=ANTHROPIC_API_KEY
-)
+def set_message_backend(backend):
+    """
+    Routes send_message() to `backend` instead of the Claude API.
+    The backend is called with the prompt and must return an object shaped like an
+    Anthropic message (`.content[0].text`). If it also has a `stream(prompt)` method
+    yielding text chunks, stream_message() uses it. Pass None to restore the real API.
+    Returns the previous backend.
+    """
+    global _message_backend
+    previous = _message_backend
+    _message_backend = backend
+    return previous
 
 
 def send_message(msg):
     """Sends a message to the Claude API and returns the response."""
-    message = client.messages.create(
+    if _message_backend is not None:
+        return _message_backend(msg)
+
+    message = get_client().messages.create(
         model=CLAUDE_MODEL,
         max_tokens=1024,
         messages=[{"role": "user", "content": msg}]
     )
     return message
 
+
+def stream_message(msg):
+    """
+    Streams a message from the Claude API, yielding text chunks as they arrive.
+    Closing the generator early closes the underlying HTTP stream.
+    """
+    if _message_backend is not None:
+        stream = getattr(_message_backend, 'stream', None)
+        if stream is not None:
+            yield from stream(msg)
+        else:
+            yield _message_backend(msg).content[0].text
+        return
+
+    with get_client().messages.stream(
+        model=CLAUDE_MODEL,
+        max_tokens=1024,
+        messages=[{"role": "user", "content": msg}]
+    ) as stream:
+        yield from stream.text_stream
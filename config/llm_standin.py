@@ -0,0 +1,129 @@
+"""Local stand-in for the Claude API with configurable latency and errors."""
+import difflib
+import json
+import random
+import re
+import threading
+import time
+from utils.normalization import normalize_no_space
+
+
+class StandInError(RuntimeError):
+    """Simulated API failure raised by the stand-in."""
+
+
+class _TextBlock:
+    def __init__(self, text):
+        self.type = 'text'
+        self.text = text
+
+
+class StandInMessage:
+    """Mimics the parts of an Anthropic message that the verifiers read."""
+
+    def __init__(self, text):
+        self.content = [_TextBlock(text)]
+
+
+# Prompt patterns used by algorithm1 and algorithm2
+_TARGET_PATTERN = re.compile(r'(?:target_name|Target Name):\s*"(.*)"')
+_CANDIDATE_PATTERN = re.compile(r'(?:search_name|Candidate Name):\s*"(.*)"')
+
+
+class StandInLLM:
+    """
+    Callable replacement for send_message(), for use with set_message_backend().
+
+    - latency: 'fixed', 'uniform' or 'lognormal'
+    - latency_ms: Fixed / median latency in milliseconds
+    - latency_spread: Lognormal sigma, or +/- fraction of latency_ms for 'uniform'
+    - error_rate: Probability that a call raises StandInError (after its latency)
+    - match_threshold: String similarity above which the stand-in answers "match"
+    - first_chunk_share: Share of the sampled latency spent before the first streamed chunk
+    - chunk_chars: Characters per streamed chunk
+    """
+
+    def __init__(self, latency='lognormal', latency_ms=800, latency_spread=0.4,
+                 error_rate=0.0, match_threshold=0.85, seed=None,
+                 first_chunk_share=0.3, chunk_chars=8):
+        if latency not in ('fixed', 'uniform', 'lognormal'):
+            raise ValueError("latency must be 'fixed', 'uniform' or 'lognormal'.")
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.latency_spread = latency_spread
+        self.error_rate = error_rate
+        self.match_threshold = match_threshold
+        self.first_chunk_share = first_chunk_share
+        self.chunk_chars = chunk_chars
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    def sample_latency(self):
+        """Draws one call latency in seconds."""
+        with self._lock:
+            if self.latency == 'fixed':
+                ms = self.latency_ms
+            elif self.latency == 'uniform':
+                spread = self.latency_ms * self.latency_spread
+                ms = self._random.uniform(self.latency_ms - spread, self.latency_ms + spread)
+            else:
+                ms = self.latency_ms * self._random.lognormvariate(0, self.latency_spread)
+        return max(ms, 0) / 1000
+
+    def _should_fail(self):
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def respond(self, prompt):
+        """Builds the JSON verdict for a prompt without any delay."""
+        target = _TARGET_PATTERN.search(prompt)
+        candidate = _CANDIDATE_PATTERN.search(prompt)
+        if target and candidate:
+            ratio = difflib.SequenceMatcher(
+                None, normalize_no_space(target.group(1)), normalize_no_space(candidate.group(1))
+            ).ratio()
+        else:
+            ratio = 0.0
+        confidence = round(ratio * 100)
+        return json.dumps({
+            "match": ratio >= self.match_threshold,
+            "confidence": confidence,
+            "explanation": (
+                f"Stand-in verdict based on normalized string similarity of {ratio:.2f} "
+                f"against a threshold of {self.match_threshold:.2f}."
+            )
+        })
+
+    def __call__(self, prompt):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.sample_latency())
+        if self._should_fail():
+            with self._lock:
+                self.errors += 1
+            raise StandInError("Simulated LLM API error.")
+        return StandInMessage(self.respond(prompt))
+
+    def stream(self, prompt):
+        """
+        Yields the response in chunks, spreading the sampled latency over the stream:
+        `first_chunk_share` of it before the first chunk, the rest evenly across chunks.
+        Stops immediately when the consumer closes the generator.
+        """
+        with self._lock:
+            self.calls += 1
+        latency = self.sample_latency()
+        text = self.respond(prompt)
+        chunks = [text[i:i + self.chunk_chars] for i in range(0, len(text), self.chunk_chars)]
+        time.sleep(latency * self.first_chunk_share)
+        if self._should_fail():
+            with self._lock:
+                self.errors += 1
+            raise StandInError("Simulated LLM API error.")
+        per_chunk = latency * (1 - self.first_chunk_share) / max(len(chunks) - 1, 1)
+        for index, chunk in enumerate(chunks):
+            if index:
+                time.sleep(per_chunk)
+            yield chunk
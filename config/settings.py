@@ -8,6 +8,22 @@ load_dotenv()
 # Confidence threshold for a name to be considered a match
 THRESHOLD = 85
 
+# Hard rule engine: reorder safe-to-reorder rules by observed cost and hit rate
+# every RULE_REORDER_INTERVAL evaluations
+ADAPTIVE_RULE_ORDERING = True
+RULE_REORDER_INTERVAL = 1000
+
+# Share one LLM call between concurrent identical verifications (same normalized
+# pair, algorithm and phonetic hint)
+LLM_REQUEST_COALESCING = True
+
+# Stream LLM responses inside verify_flow/verify_name. These return a JSON string
+# that includes the explanation, so streaming only shortens time-to-decision when
+# LLM_EXPLANATIONS is off (the stream is closed right after the verdict). To act on
+# the verdict early and still read the explanation, use verify_flow_streamed.
+LLM_STREAMING = False
+LLM_EXPLANATIONS = True
+
 # Anthropic API configuration
 # Try Streamlit secrets first (for Streamlit Cloud), then fall back to environment variables
 def get_secret(key, default=None):
@@ -0,0 +1,150 @@
+"""Bundled name lists and variant tables for synthetic corpus generation."""
+
+# Given names per culture as (name, gender) with gender 'm' or 'f'
+GIVEN_NAMES = {
+    'english': [
+        ('Robert', 'm'), ('William', 'm'), ('James', 'm'), ('Michael', 'm'), ('Thomas', 'm'),
+        ('Richard', 'm'), ('Joseph', 'm'), ('Edward', 'm'), ('Anthony', 'm'), ('Daniel', 'm'),
+        ('Steven', 'm'), ('Christopher', 'm'), ('Jonathan', 'm'), ('Samuel', 'm'), ('Sean', 'm'),
+        ('Elizabeth', 'f'), ('Katherine', 'f'), ('Margaret', 'f'), ('Jennifer', 'f'), ('Patricia', 'f'),
+        ('Sarah', 'f'), ('Emily', 'f'), ('Rebecca', 'f'), ('Michelle', 'f'), ('Danielle', 'f'),
+    ],
+    'hispanic': [
+        ('Mario', 'm'), ('Antonio', 'm'), ('Roberto', 'm'), ('Carlos', 'm'), ('Julio', 'm'),
+        ('Francisco', 'm'), ('Alejandro', 'm'), ('Diego', 'm'), ('Pablo', 'm'), ('Luis', 'm'),
+        ('Maria', 'f'), ('Antonia', 'f'), ('Roberta', 'f'), ('Carla', 'f'), ('Julia', 'f'),
+        ('Francisca', 'f'), ('Alejandra', 'f'), ('Lucia', 'f'), ('Sofia', 'f'), ('Isabel', 'f'),
+    ],
+    'arabic': [
+        ('Mohammed', 'm'), ('Ahmed', 'm'), ('Yusuf', 'm'), ('Omar', 'm'), ('Hassan', 'm'),
+        ('Khaled', 'm'), ('Abdulrahman', 'm'), ('Mustafa', 'm'), ('Hussein', 'm'), ('Ibrahim', 'm'),
+        ('Ali', 'm'), ('Tariq', 'm'), ('Samir', 'm'), ('Karim', 'm'), ('Abdullah', 'm'),
+        ('Fatima', 'f'), ('Aisha', 'f'), ('Layla', 'f'), ('Mariam', 'f'), ('Zahra', 'f'),
+        ('Noor', 'f'), ('Samira', 'f'), ('Karima', 'f'), ('Huda', 'f'), ('Salma', 'f'),
+    ],
+    'slavic': [
+        ('Aleksandr', 'm'), ('Mikhail', 'm'), ('Sergei', 'm'), ('Dmitri', 'm'), ('Nikolai', 'm'),
+        ('Ivan', 'm'), ('Yevgeny', 'm'), ('Vladimir', 'm'), ('Pavel', 'm'), ('Andrei', 'm'),
+        ('Aleksandra', 'f'), ('Natalia', 'f'), ('Olga', 'f'), ('Irina', 'f'), ('Tatiana', 'f'),
+        ('Yevgenia', 'f'), ('Svetlana', 'f'), ('Ivana', 'f'), ('Anastasia', 'f'), ('Yulia', 'f'),
+    ],
+    'italian': [
+        ('Francesco', 'm'), ('Giovanni', 'm'), ('Paolo', 'm'), ('Carlo', 'm'), ('Marco', 'm'),
+        ('Luca', 'm'), ('Stefano', 'm'), ('Matteo', 'm'),
+        ('Francesca', 'f'), ('Giovanna', 'f'), ('Paola', 'f'), ('Chiara', 'f'), ('Elena', 'f'),
+        ('Giulia', 'f'), ('Alessandra', 'f'), ('Valentina', 'f'),
+    ],
+    'east_asian': [
+        ('Wei', 'm'), ('Jun', 'm'), ('Hiroshi', 'm'), ('Takeshi', 'm'), ('Minho', 'm'),
+        ('Jiwon', 'f'), ('Mei', 'f'), ('Yuki', 'f'), ('Sakura', 'f'), ('Seoyeon', 'f'),
+    ],
+    'south_asian': [
+        ('Rahul', 'm'), ('Arjun', 'm'), ('Vikram', 'm'), ('Sanjay', 'm'), ('Ravi', 'm'),
+        ('Priya', 'f'), ('Anjali', 'f'), ('Deepa', 'f'), ('Kavita', 'f'), ('Lakshmi', 'f'),
+    ],
+}
+
+SURNAMES = {
+    'english': [
+        'Smith', 'Johnson', 'Thompson', 'Turner', 'Carter', 'Ellensworth', 'McDonald', "O'Connor",
+        "O'Brien", 'Williams', 'Harrison', 'Fitzgerald', 'Whitaker', 'Bradley', 'Morrison',
+    ],
+    'hispanic': [
+        'Gonzalez', 'Rodriguez', 'Hernandez', 'Martinez', 'Lopez', 'Ramirez', 'Torres', 'Navarro',
+        'Castillo', 'Delgado', 'Fuentes', 'Vargas',
+    ],
+    'arabic': [
+        'Al Rashid', 'Al Fayed', 'Al Qasim', 'Al Saud', 'Al Hilal', 'Haddad', 'Nasser', 'Khalil',
+        'Mansour', 'Saleh', 'Al Khattab', 'Hamdan', 'Barakat', 'Aziz',
+    ],
+    'slavic': [
+        'Petrov', 'Ivanov', 'Gorbachev', 'Dargulov', 'Smirnov', 'Volkov', 'Sokolov', 'Morozov',
+        'Lebedev', 'Kuznetsov', 'Popov', 'Novikov',
+    ],
+    'italian': [
+        'Rossi', 'Russo', 'Ferrari', 'Esposito', 'Bianchi', 'Romano', 'Colombo', 'Ricci',
+        'Marino', 'Greco',
+    ],
+    'east_asian': [
+        'Park', 'Kim', 'Lee', 'Wang', 'Zhang', 'Chen', 'Tanaka', 'Suzuki', 'Yamamoto', 'Choi',
+    ],
+    'south_asian': [
+        'Sharma', 'Patel', 'Singh', 'Gupta', 'Reddy', 'Iyer', 'Nair', 'Mehta', 'Kapoor', 'Rao',
+    ],
+}
+
+# Cultures whose full names may carry a patronymic "ibn" / "bin" segment
+PATRONYMIC_CULTURES = {'arabic': ('ibn', 'bin')}
+
+# Formal name -> accepted nicknames (Bob/Robert is a match)
+NICKNAMES = {
+    'Robert': ['Bob', 'Rob', 'Bobby'],
+    'William': ['Bill', 'Will'],
+    'James': ['Jim', 'Jimmy'],
+    'Michael': ['Mike'],
+    'Thomas': ['Tom', 'Tommy'],
+    'Richard': ['Rick', 'Dick'],
+    'Joseph': ['Joe'],
+    'Edward': ['Ed', 'Ted'],
+    'Anthony': ['Tony'],
+    'Daniel': ['Dan', 'Danny'],
+    'Steven': ['Steve'],
+    'Christopher': ['Chris'],
+    'Jonathan': ['Jon'],
+    'Samuel': ['Sam'],
+    'Elizabeth': ['Liz', 'Beth'],
+    'Katherine': ['Kate', 'Kathy'],
+    'Margaret': ['Maggie', 'Peggy'],
+    'Jennifer': ['Jen', 'Jenny'],
+    'Patricia': ['Pat', 'Patty'],
+    'Rebecca': ['Becky'],
+    'Aleksandr': ['Sasha'],
+    'Dmitri': ['Dima'],
+    'Francisco': ['Paco'],
+}
+
+# Spellings of the same name across transliterations (any two in a group match)
+TRANSLITERATIONS = [
+    ['Mohammed', 'Muhammad', 'Mohamed', 'Mohammad'],
+    ['Ahmed', 'Ahmad'],
+    ['Yusuf', 'Youssef', 'Yousef'],
+    ['Omar', 'Umar'],
+    ['Hassan', 'Hasan'],
+    ['Khaled', 'Khalid'],
+    ['Hussein', 'Husain', 'Hussain'],
+    ['Mustafa', 'Mustapha'],
+    ['Abdulrahman', 'Abdul Rahman', 'Abdelrahman'],
+    ['Abdullah', 'Abdallah'],
+    ['Aisha', 'Aysha', 'Ayesha'],
+    ['Fatima', 'Fatimah'],
+    ['Mariam', 'Maryam'],
+    ['Aleksandr', 'Alexander', 'Aleksander'],
+    ['Mikhail', 'Mikhael'],
+    ['Sergei', 'Sergey'],
+    ['Dmitri', 'Dmitry', 'Dmitriy'],
+    ['Nikolai', 'Nikolay'],
+    ['Yevgeny', 'Evgeny', 'Evgeni'],
+    ['Andrei', 'Andrey'],
+    ['Natalia', 'Natalya'],
+    ['Tatiana', 'Tatyana'],
+    ['Yulia', 'Julia', 'Yuliya'],
+    ['Steven', 'Stephen'],
+    ['Katherine', 'Catherine', 'Kathryn'],
+    ['Sean', 'Shawn', 'Shaun'],
+    ['Jonathan', 'Jonathon'],
+    ['Sarah', 'Sara'],
+    ['Qasim', 'Kasim'],
+]
+
+# Surname ending swaps that keep identity (-ov/-off, Mc/Mac)
+SURNAME_VARIANT_ENDINGS = [('ov', 'off'), ('ev', 'eff')]
+SURNAME_VARIANT_PREFIXES = [('Mc', 'Mac')]
+
+# Given-name pairs that differ only by a gendered ending (a non-match)
+GENDERED_PAIRS = [
+    ('Mario', 'Maria'), ('Antonio', 'Antonia'), ('Roberto', 'Roberta'), ('Carlo', 'Carla'),
+    ('Julio', 'Julia'), ('Francisco', 'Francisca'), ('Alejandro', 'Alejandra'), ('Francesco', 'Francesca'),
+    ('Giovanni', 'Giovanna'), ('Paolo', 'Paola'), ('Aleksandr', 'Aleksandra'), ('Yevgeny', 'Yevgenia'),
+    ('Ivan', 'Ivana'), ('Samir', 'Samira'), ('Karim', 'Karima'), ('Michael', 'Michelle'),
+    ('Daniel', 'Danielle'), ('Gabriel', 'Gabrielle'),
+]
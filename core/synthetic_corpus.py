@@ -0,0 +1,312 @@
+"""Seeded synthetic generator for labeled name-pair corpora."""
+import json
+import random
+from utils.normalization import normalize
+from core.name_lists import (
+    GIVEN_NAMES, SURNAMES, PATRONYMIC_CULTURES, NICKNAMES, TRANSLITERATIONS,
+    SURNAME_VARIANT_ENDINGS, SURNAME_VARIANT_PREFIXES, GENDERED_PAIRS,
+)
+
+# Relative frequency of each perturbation type and whether it preserves identity
+PERTURBATIONS = {
+    'case_change': (1.0, True),
+    'typo': (1.5, True),
+    'transposition': (1.5, True),
+    'hyphen_change': (1.0, True),
+    'apostrophe_change': (0.5, True),
+    'nickname': (1.0, True),
+    'transliteration': (1.5, True),
+    'gendered_ending': (1.0, False),
+    'token_order_swap': (1.0, False),
+    'surname_suffix': (1.0, False),
+    'different_given_name': (1.0, False),
+}
+
+# Base names drawn per record before giving up on a perturbation type
+_MAX_ATTEMPTS = 200
+
+# Adjacent keys on a QWERTY keyboard, for realistic substitution typos
+_KEYBOARD_NEIGHBORS = {
+    'a': 'qsz', 'b': 'vn', 'c': 'xv', 'd': 'sf', 'e': 'wr', 'f': 'dg', 'g': 'fh', 'h': 'gj',
+    'i': 'uo', 'j': 'hk', 'k': 'jl', 'l': 'k', 'm': 'n', 'n': 'bm', 'o': 'ip', 'p': 'o',
+    'q': 'wa', 'r': 'et', 's': 'ad', 't': 'ry', 'u': 'yi', 'v': 'cb', 'w': 'qe', 'x': 'zc',
+    'y': 'tu', 'z': 'x',
+}
+
+_TRANSLITERATION_GROUPS = {name: group for group in TRANSLITERATIONS for name in group}
+_GENDER_SWAPS = dict(GENDERED_PAIRS)
+_GENDER_SWAPS.update({f: m for m, f in GENDERED_PAIRS})
+_NICKNAME_TO_FORMAL = {nick: formal for formal, nicks in NICKNAMES.items() for nick in nicks}
+_CULTURES = sorted(GIVEN_NAMES)
+
+
+def _random_base_name(rng):
+    """
+    Draws a base name as a list of segments [given, *middle, surname].
+    A segment may contain spaces (e.g., "Al Rashid") but is treated as one unit.
+    """
+    culture = rng.choice(_CULTURES)
+    given, gender = rng.choice(GIVEN_NAMES[culture])
+    segments = [given]
+    particles = PATRONYMIC_CULTURES.get(culture)
+    if particles and rng.random() < 0.2:
+        father = rng.choice([name for name, g in GIVEN_NAMES[culture] if g == 'm'])
+        segments += [rng.choice(particles), father]
+    segments.append(rng.choice(SURNAMES[culture]))
+    return culture, segments
+
+
+def _join(segments):
+    return ' '.join(segments)
+
+
+def _word_positions(segments, min_length=4):
+    """Returns (segment_index, word_index) for words long enough to perturb."""
+    positions = []
+    for s_index, segment in enumerate(segments):
+        for w_index, word in enumerate(segment.split(' ')):
+            if len(word) >= min_length:
+                positions.append((s_index, w_index))
+    return positions
+
+
+def _replace_word(segments, position, new_word):
+    s_index, w_index = position
+    words = segments[s_index].split(' ')
+    words[w_index] = new_word
+    return segments[:s_index] + [' '.join(words)] + segments[s_index + 1:]
+
+
+def _case_change(segments, rng):
+    name = _join(segments)
+    return rng.choice([name.lower(), name.upper(), name.swapcase()])
+
+
+def _typo(segments, rng):
+    positions = _word_positions(segments, min_length=5)
+    if not positions:
+        return None
+    position = rng.choice(positions)
+    word = segments[position[0]].split(' ')[position[1]]
+    # Never touch the first letter (rarely mistyped) or the last one, which carries
+    # gendered and surname endings (Samira -> Samir is a different name, not a typo)
+    i = rng.randrange(1, len(word) - 1)
+    op = rng.choice(('substitute', 'delete', 'duplicate'))
+    if op == 'substitute':
+        neighbors = _KEYBOARD_NEIGHBORS.get(word[i].lower())
+        if not neighbors:
+            return None
+        new_word = word[:i] + rng.choice(neighbors) + word[i + 1:]
+    elif op == 'delete':
+        new_word = word[:i] + word[i + 1:]
+    else:
+        new_word = word[:i] + word[i] + word[i:]
+    return _join(_replace_word(segments, position, new_word))
+
+
+def _transposition(segments, rng):
+    positions = _word_positions(segments, min_length=4)
+    rng.shuffle(positions)
+    for position in positions:
+        word = segments[position[0]].split(' ')[position[1]]
+        swaps = [i for i in range(1, len(word) - 1) if word[i] != word[i + 1]]
+        if swaps:
+            i = rng.choice(swaps)
+            new_word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+            return _join(_replace_word(segments, position, new_word))
+    return None
+
+
+def _hyphen_change(segments, rng):
+    multi = [i for i, segment in enumerate(segments) if ' ' in segment]
+    if not multi:
+        return None
+    i = rng.choice(multi)
+    new_segment = segments[i].replace(' ', rng.choice(('-', '')))
+    return _join(segments[:i] + [new_segment] + segments[i + 1:])
+
+
+def _apostrophe_change(segments, rng):
+    name = _join(segments)
+    if "'" not in name:
+        return None
+    return name.replace("'", rng.choice(('', ' ', '’')))
+
+
+def _nickname(segments, rng):
+    given = segments[0]
+    if given in NICKNAMES:
+        new_given = rng.choice(NICKNAMES[given])
+    elif given in _NICKNAME_TO_FORMAL:
+        new_given = _NICKNAME_TO_FORMAL[given]
+    else:
+        return None
+    return _join([new_given] + segments[1:])
+
+
+def _transliteration(segments, rng):
+    options = []
+    group = _TRANSLITERATION_GROUPS.get(segments[0])
+    if group:
+        options.append(_join([rng.choice([g for g in group if g != segments[0]])] + segments[1:]))
+
+    surname = segments[-1]
+    for old, new in SURNAME_VARIANT_ENDINGS:
+        if surname.endswith(old):
+            options.append(_join(segments[:-1] + [surname[:-len(old)] + new]))
+    for old, new in SURNAME_VARIANT_PREFIXES:
+        if surname.startswith(old):
+            options.append(_join(segments[:-1] + [new + surname[len(old):]]))
+    return rng.choice(options) if options else None
+
+
+def _gendered_ending(segments, rng):
+    swapped = _GENDER_SWAPS.get(segments[0])
+    if swapped is None:
+        return None
+    return _join([swapped] + segments[1:])
+
+
+def _token_order_swap(segments, rng):
+    if len(segments) < 2 or segments[0] == segments[-1]:
+        return None
+    return _join([segments[-1]] + segments[1:-1] + [segments[0]])
+
+
+def _surname_suffix(segments, rng):
+    surname = segments[-1]
+    if surname.endswith(('ov', 'ev', 'in')):
+        new_surname = surname + 'a'
+    elif surname[-1].lower() not in 'aeiouy':
+        new_surname = surname + 'i'
+    else:
+        return None
+    return _join(segments[:-1] + [new_surname])
+
+
+def _different_given_name(segments, rng, culture):
+    given = segments[0]
+    related = set(_TRANSLITERATION_GROUPS.get(given, ())) | set(NICKNAMES.get(given, ()))
+    related.add(_GENDER_SWAPS.get(given))
+    choices = [name for name, _ in GIVEN_NAMES[culture] if name != given and name not in related]
+    return _join([rng.choice(choices)] + segments[1:])
+
+
+def _identity_changes(segments):
+    """Returns the deterministic non-match variants of a name, normalized for comparison."""
+    variants = set()
+    for func in (_gendered_ending, _token_order_swap, _surname_suffix):
+        variant = func(segments, None)
+        if variant is not None:
+            variants.add(normalize(variant))
+    return variants
+
+
+_PERTURB_FUNCS = {
+    'case_change': _case_change,
+    'typo': _typo,
+    'transposition': _transposition,
+    'hyphen_change': _hyphen_change,
+    'apostrophe_change': _apostrophe_change,
+    'nickname': _nickname,
+    'transliteration': _transliteration,
+    'gendered_ending': _gendered_ending,
+    'token_order_swap': _token_order_swap,
+    'surname_suffix': _surname_suffix,
+}
+
+
+def _apply(kind, segments, rng, culture):
+    if kind == 'different_given_name':
+        return _different_given_name(segments, rng, culture)
+    return _PERTURB_FUNCS[kind](segments, rng)
+
+
+def generate_pairs(count, seed=0, perturbations=None):
+    """
+    Yields `count` labeled pair records, one at a time (constant memory).
+
+    Each record has: target, candidate, expected_match, perturbation_type, culture.
+    - perturbations: Optional {type: weight} override restricting or reweighting PERTURBATIONS.
+    The same seed always produces the same sequence.
+    """
+    rng = random.Random(seed)
+    weights = perturbations or {kind: weight for kind, (weight, _) in PERTURBATIONS.items()}
+    unknown = set(weights) - set(PERTURBATIONS)
+    if unknown:
+        raise ValueError(f"Unknown perturbation types: {sorted(unknown)}")
+    kinds = list(weights)
+    kind_weights = [weights[kind] for kind in kinds]
+
+    produced = 0
+    while produced < count:
+        kind = rng.choices(kinds, weights=kind_weights)[0]
+        # Most perturbations only apply to some names; redraw the base name until one fits
+        for _ in range(_MAX_ATTEMPTS):
+            culture, segments = _random_base_name(rng)
+            target = _join(segments)
+            candidate = _apply(kind, segments, rng, culture)
+            if candidate is None or candidate == target:
+                continue
+            # A matching perturbation must never reproduce a non-match variant of the
+            # same name, or the corpus would hold one pair under both labels
+            if PERTURBATIONS[kind][1] and normalize(candidate) in _identity_changes(segments):
+                continue
+            break
+        else:
+            continue
+        # Present each pair in either direction
+        if rng.random() < 0.5:
+            target, candidate = candidate, target
+        produced += 1
+        yield {
+            "target": target,
+            "candidate": candidate,
+            "expected_match": PERTURBATIONS[kind][1],
+            "perturbation_type": kind,
+            "culture": culture,
+        }
+
+
+def write_jsonl(records, path):
+    """Streams records to a JSONL file. Returns the number of records written."""
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+            written += 1
+    return written
+
+
+def write_parquet(records, path, batch_size=50000):
+    """
+    Streams records to a Parquet file in row groups of `batch_size`.
+    Requires pyarrow. Returns the number of records written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet output requires pyarrow. Install it with: pip install pyarrow") from e
+
+    schema = pa.schema([
+        ('target', pa.string()),
+        ('candidate', pa.string()),
+        ('expected_match', pa.bool_()),
+        ('perturbation_type', pa.string()),
+        ('culture', pa.string()),
+    ])
+    written = 0
+    batch = []
+    with pq.ParquetWriter(path, schema) as writer:
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                written += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            written += len(batch)
+    return written
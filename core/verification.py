@@ -1,9 +1,31 @@
 """Core name verification orchestration."""
-from metaphone import doublemetaphone
 from utils.normalization import normalize
+from utils.alignment import aligned_pairs, sounds_alike
 from rules.hard_rules import check_hard_rules
-from algorithms.algorithm1 import verify_name_algorithm1
-from algorithms.algorithm2 import verify_name_algorithm2
+from algorithms.algorithm1 import verify_name_algorithm1, verify_name_algorithm1_async
+from algorithms.algorithm2 import (
+    verify_name_algorithm2, verify_name_algorithm2_async, verify_name_algorithm2_streamed,
+)
+from utils.verdict_stream import StreamedVerdict
+
+
+def needs_phonetic_hint(latest_name, user_input):
+    """
+    Determines whether the LLM should be warned about a risky phonetic match:
+    the names sound alike but the phonetic rule declined to approve them.
+    """
+    t_norm = normalize(latest_name)
+    c_norm = normalize(user_input)
+    from utils.phonetic import check_phonetic_with_risk_assessment
+    phonetic_result = check_phonetic_with_risk_assessment(t_norm, c_norm)
+
+    # Determine if a risky phonetic match occurred.
+    pairs = aligned_pairs(t_norm, c_norm)
+    is_phonetically_matched = pairs is not None and all(
+        sounds_alike(t1, t2) for t1, t2 in pairs
+    )
+    # Provide a hint if names are phonetically similar but were flagged as risky.
+    return is_phonetically_matched and phonetic_result is None
 
 
 def verify_name(latest_name, user_input, algorithm=2):
@@ -25,22 +47,7 @@ def verify_name(latest_name, user_input, algorithm=2):
             return hard_result, 'hard_rule'
 
         # If hard rules didn't yield a result, check if a phonetic hint is needed for the LLM.
-        t_norm = normalize(latest_name)
-        c_norm = normalize(user_input)
-        from utils.phonetic import check_phonetic_with_risk_assessment
-        phonetic_result = check_phonetic_with_risk_assessment(t_norm, c_norm)
-
-        # Determine if a risky phonetic match occurred.
-        t_tokens = t_norm.split()
-        c_tokens = c_norm.split()
-        is_phonetically_matched = False
-        if len(t_tokens) == len(c_tokens):
-            is_phonetically_matched = all(
-                set(doublemetaphone(t1)) & set(doublemetaphone(t2)) - {''}
-                for t1, t2 in zip(t_tokens, c_tokens)
-            )
-        # Provide a hint if names are phonetically similar but were flagged as risky.
-        phonetic_hint = is_phonetically_matched and phonetic_result is None
+        phonetic_hint = needs_phonetic_hint(latest_name, user_input)
 
         # Call the advanced LLM verification with the hint if applicable.
         llm_result = verify_name_algorithm2(latest_name, user_input, phonetic_hint=phonetic_hint)
@@ -49,6 +56,28 @@ def verify_name(latest_name, user_input, algorithm=2):
         raise ValueError("Algorithm must be 1 or 2.")
 
 
+async def verify_name_async(latest_name, user_input, algorithm=2):
+    """
+    Asyncio variant of verify_name. Hard rules run inline; LLM calls run in the
+    default executor and are coalesced with identical in-flight requests.
+    Returns a tuple: (result_json_string, source_of_decision)
+    """
+    if algorithm == 1:
+        llm_result = await verify_name_algorithm1_async(latest_name, user_input)
+        return llm_result, 'llm'
+
+    elif algorithm == 2:
+        hard_result = check_hard_rules(latest_name, user_input)
+        if hard_result:
+            return hard_result, 'hard_rule'
+
+        phonetic_hint = needs_phonetic_hint(latest_name, user_input)
+        llm_result = await verify_name_algorithm2_async(latest_name, user_input, phonetic_hint=phonetic_hint)
+        return llm_result, 'llm'
+    else:
+        raise ValueError("Algorithm must be 1 or 2.")
+
+
 def verify_flow(latest_name, user_input):
     """
     Alias for the default verification flow, which uses Algorithm 2.
@@ -56,3 +85,26 @@ def verify_flow(latest_name, user_input):
     """
     return verify_name(latest_name, user_input, algorithm=2)
 
+
+def verify_flow_streamed(latest_name, user_input):
+    """
+    Default verification flow that returns the LLM decision before its explanation.
+    Returns a tuple: (StreamedVerdict, source_of_decision)
+    - For LLM decisions, `match` and `confidence` are set as soon as they are streamed;
+      `explanation` is read on first access, or skipped by calling close().
+    - Hard-rule decisions are wrapped in an already complete StreamedVerdict.
+    """
+    hard_result = check_hard_rules(latest_name, user_input)
+    if hard_result:
+        return StreamedVerdict.from_text(hard_result), 'hard_rule'
+
+    phonetic_hint = needs_phonetic_hint(latest_name, user_input)
+    return verify_name_algorithm2_streamed(latest_name, user_input, phonetic_hint=phonetic_hint), 'llm'
+
+
+async def verify_flow_async(latest_name, user_input):
+    """
+    Asyncio variant of verify_flow.
+    Returns a tuple: (result_json_string, source_of_decision)
+    """
+    return await verify_name_async(latest_name, user_input, algorithm=2)
@@ -0,0 +1,32 @@
+"""
+Generates a synthetic labeled name-pair corpus.
+
+Examples:
+    python generate_corpus.py --count 1000000 --output pairs.jsonl
+    python generate_corpus.py --count 5000000 --output pairs.parquet --seed 7
+"""
+import argparse
+import time
+from core.synthetic_corpus import generate_pairs, write_jsonl, write_parquet
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate labeled (target, candidate) name pairs.")
+    parser.add_argument('--count', type=int, default=100000, help="Number of pairs to generate")
+    parser.add_argument('--output', required=True, help="Output path (.jsonl or .parquet)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--batch-size', type=int, default=50000, help="Parquet row group size")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    records = generate_pairs(args.count, seed=args.seed)
+    if args.output.endswith('.parquet'):
+        written = write_parquet(records, args.output, batch_size=args.batch_size)
+    else:
+        written = write_jsonl(records, args.output)
+    elapsed = time.time() - start_time
+    print(f"Wrote {written} pairs to {args.output} in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
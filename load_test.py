@@ -0,0 +1,231 @@
+"""
+End-to-end load generator for the verification pipeline.
+
+Replays a name-pair corpus against verify_flow at a target QPS, with the
+Claude API replaced by a local stand-in of configurable latency and error rate.
+
+Examples:
+    python load_test.py --qps 200 --duration 30
+    python load_test.py --mode closed --concurrency 64 --duration 30
+    python load_test.py --corpus pairs.jsonl --qps 500 --llm-latency-ms 1200 --llm-error-rate 0.02
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from test_cases import TEST_CASES
+from config.claude_client import set_message_backend
+from config.llm_standin import StandInLLM
+from core.verification import verify_flow
+from utils.singleflight import llm_flight
+
+
+def load_corpus(path=None, scale=1):
+    """
+    Loads (target, candidate) pairs.
+    - path: JSONL file with "target" and "candidate" fields; defaults to TEST_CASES.
+    - scale: Number of times the corpus is repeated.
+    """
+    if path:
+        pairs = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    pairs.append((record['target'], record['candidate']))
+    else:
+        pairs = [(target, candidate) for target, candidate, _, _ in TEST_CASES]
+    return pairs * max(scale, 1)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class LoadRecorder:
+    """Thread-safe collection of per-request samples."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = []
+
+    def record(self, source, latency, queue_delay):
+        with self._lock:
+            self.samples.append((source, latency, queue_delay))
+
+
+def _run_one(pair, scheduled_at, recorder):
+    """Runs a single verification and records its latency and queueing delay."""
+    started_at = time.perf_counter()
+    try:
+        _, source = verify_flow(*pair)
+    except Exception:
+        source = 'error'
+    finished_at = time.perf_counter()
+    recorder.record(source, finished_at - started_at, started_at - scheduled_at)
+
+
+def run_open_loop(pairs, qps, duration, concurrency, recorder, poisson=False, seed=None):
+    """
+    Issues requests on a fixed schedule regardless of completions.
+    When the pipeline cannot keep up, requests wait in the executor queue and
+    the wait shows up as queueing delay.
+    """
+    rng = random.Random(seed)
+    total = int(qps * duration)
+    start = time.perf_counter()
+    next_at = start
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for i in range(total):
+            now = time.perf_counter()
+            if next_at > now:
+                time.sleep(next_at - now)
+            executor.submit(_run_one, pairs[i % len(pairs)], next_at, recorder)
+            next_at += rng.expovariate(qps) if poisson else 1 / qps
+    return time.perf_counter() - start
+
+
+def run_closed_loop(pairs, duration, concurrency, recorder, think_time=0.0):
+    """
+    Runs `concurrency` workers that each issue the next request as soon as the
+    previous one completes (plus optional think time). Throughput is what the
+    pipeline sustains; there is no queueing delay by construction.
+    """
+    stop_at = time.perf_counter() + duration
+    counter = iter(range(10 ** 12))
+    counter_lock = threading.Lock()
+
+    def worker():
+        while time.perf_counter() < stop_at:
+            with counter_lock:
+                i = next(counter)
+            _run_one(pairs[i % len(pairs)], time.perf_counter(), recorder)
+            if think_time:
+                time.sleep(think_time)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def build_report(recorder, elapsed, llm, target_qps=None):
+    """Summarizes the recorded samples into a report dictionary."""
+    samples = recorder.samples
+    by_source = {}
+    for source, latency, _ in samples:
+        by_source.setdefault(source, []).append(latency)
+
+    def summary(latencies):
+        return {
+            "count": len(latencies),
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+        }
+
+    queue_delays = [delay for _, _, delay in samples]
+    return {
+        "requests": len(samples),
+        "elapsed_s": elapsed,
+        "target_qps": target_qps,
+        "throughput_qps": len(samples) / elapsed if elapsed else 0.0,
+        "latency": summary([latency for _, latency, _ in samples]),
+        "latency_by_source": {source: summary(values) for source, values in sorted(by_source.items())},
+        "queue_delay": summary(queue_delays),
+        "llm_calls": llm.calls,
+        "llm_errors": llm.errors,
+        "llm_calls_per_s": llm.calls / elapsed if elapsed else 0.0,
+        "llm_call_ratio": llm.calls / len(samples) if samples else 0.0,
+        "llm_coalesced": llm_flight.followers,
+    }
+
+
+def print_report(report):
+    """Prints the report in the same layout as test_runner."""
+    print("=" * 80)
+    print("Load Test Summary")
+    print("=" * 80)
+    print()
+    print(f"Requests: {report['requests']} in {report['elapsed_s']:.2f}s")
+    if report['target_qps']:
+        print(f"Target QPS: {report['target_qps']}")
+    print(f"Throughput: {report['throughput_qps']:.1f} verifications/s")
+    print()
+
+    def line(label, s):
+        print(f"  {label:<12} n={s['count']:<8} p50={s['p50_ms']:.1f}ms  p95={s['p95_ms']:.1f}ms  p99={s['p99_ms']:.1f}ms")
+
+    print("Latency:")
+    line("all", report['latency'])
+    for source, s in report['latency_by_source'].items():
+        line(source, s)
+    print()
+    print("Queueing Delay:")
+    line("all", report['queue_delay'])
+    print()
+    print(f"LLM Calls: {report['llm_calls']} ({report['llm_calls_per_s']:.1f}/s, "
+          f"{report['llm_call_ratio'] * 100:.1f}% of verifications)")
+    print(f"LLM Errors: {report['llm_errors']}")
+    print(f"LLM Calls Coalesced: {report['llm_coalesced']}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive verify_flow at a target load with a local LLM stand-in.")
+    parser.add_argument('--corpus', help="JSONL file with 'target' and 'candidate' fields (default: TEST_CASES)")
+    parser.add_argument('--scale', type=int, default=1, help="Repeat the corpus this many times")
+    parser.add_argument('--mode', choices=['open', 'closed'], default='open')
+    parser.add_argument('--qps', type=float, default=50, help="Target arrival rate (open loop)")
+    parser.add_argument('--poisson', action='store_true', help="Poisson arrivals instead of a fixed interval")
+    parser.add_argument('--duration', type=float, default=10, help="Run time in seconds")
+    parser.add_argument('--concurrency', type=int, default=64, help="Worker threads")
+    parser.add_argument('--think-time-ms', type=float, default=0, help="Pause between requests (closed loop)")
+    parser.add_argument('--llm-latency', choices=['fixed', 'uniform', 'lognormal'], default='lognormal')
+    parser.add_argument('--llm-latency-ms', type=float, default=800)
+    parser.add_argument('--llm-latency-spread', type=float, default=0.4)
+    parser.add_argument('--llm-error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args()
+
+    pairs = load_corpus(args.corpus, args.scale)
+    llm = StandInLLM(
+        latency=args.llm_latency,
+        latency_ms=args.llm_latency_ms,
+        latency_spread=args.llm_latency_spread,
+        error_rate=args.llm_error_rate,
+        seed=args.seed,
+    )
+    previous_backend = set_message_backend(llm)
+    recorder = LoadRecorder()
+    try:
+        if args.mode == 'open':
+            elapsed = run_open_loop(pairs, args.qps, args.duration, args.concurrency, recorder,
+                                    poisson=args.poisson, seed=args.seed)
+        else:
+            elapsed = run_closed_loop(pairs, args.duration, args.concurrency, recorder,
+                                      think_time=args.think_time_ms / 1000)
+    finally:
+        set_message_backend(previous_backend)
+
+    report = build_report(recorder, elapsed, llm, target_qps=args.qps if args.mode == 'open' else None)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
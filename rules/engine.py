@@ -0,0 +1,197 @@
+"""Pluggable rule engine with cost-aware, adaptive rule ordering."""
+import threading
+import time
+from utils.normalization import normalize
+from utils.transliteration import is_surname_first
+
+# Possible short-circuit outcomes a rule declares
+ACCEPT = 'accept'
+REJECT = 'reject'
+
+# Prior used before (and blended with) observed statistics: the declared cost counts
+# as PRIOR_CALLS evaluations that fired at PRIOR_HIT_RATE. Observations take over as
+# they accumulate, and the estimate stays in one unit (seconds per hit) throughout.
+PRIOR_CALLS = 20
+PRIOR_HIT_RATE = 0.1
+
+
+class RuleContext:
+    """
+    Inputs shared by every rule for one (target, candidate) pair.
+    Normalization is done once here instead of once per rule.
+    `t_surname_first`/`c_surname_first` mark names romanized from a surname-first script.
+    """
+    __slots__ = ('target', 'candidate', 't_norm', 'c_norm', 't_tokens', 'c_tokens',
+                 't_surname_first', 'c_surname_first')
+
+    def __init__(self, target, candidate):
+        self.target = target
+        self.candidate = candidate
+        self.t_norm = normalize(target)
+        self.c_norm = normalize(candidate)
+        self.t_tokens = self.t_norm.split()
+        self.c_tokens = self.c_norm.split()
+        self.t_surname_first = bool(target) and is_surname_first(target)
+        self.c_surname_first = bool(candidate) and is_surname_first(candidate)
+
+
+class Rule:
+    """
+    A single deterministic rule.
+    - func: Called with a RuleContext; returns a result JSON string or None.
+    - cost: Estimated execution time in microseconds, used until statistics accumulate.
+    - outcomes: Which verdicts the rule can short-circuit to (ACCEPT and/or REJECT).
+      Reorderable rules only swap with adjacent rules that declare the same outcomes.
+    - reorderable: Whether the engine may move the rule; fixed rules keep their position.
+    """
+
+    def __init__(self, name, func, cost=5.0, outcomes=(ACCEPT, REJECT), reorderable=False):
+        self.name = name
+        self.func = func
+        self.cost = cost
+        self.outcomes = frozenset(outcomes)
+        self.reorderable = reorderable
+        self.calls = 0
+        self.hits = 0
+        self.total_time = 0.0
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.calls if self.calls else 0.0
+
+    @property
+    def avg_time(self):
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def expected_cost(self):
+        """
+        Expected seconds spent per hit: cheaper rules that fire more often sort first.
+        The declared cost acts as a prior, so new and measured rules compare in one unit.
+        """
+        calls = self.calls + PRIOR_CALLS
+        avg_time = (self.total_time + self.cost * 1e-6 * PRIOR_CALLS) / calls
+        hit_rate = (self.hits + PRIOR_HIT_RATE * PRIOR_CALLS) / calls
+        return avg_time / hit_rate
+
+
+class RuleEngine:
+    """
+    Runs rules in order and returns the first non-None result.
+    Records per-rule hit rates and execution time, and can reorder
+    reorderable rules by expected cost.
+    """
+
+    def __init__(self, rules=None, adaptive=False, reorder_interval=1000):
+        self._rules = list(rules or [])
+        self._lock = threading.Lock()
+        self.adaptive = adaptive
+        self.reorder_interval = reorder_interval
+        self._evaluations = 0
+
+    @property
+    def rules(self):
+        return list(self._rules)
+
+    def register(self, rule, before=None, after=None):
+        """
+        Adds a rule to the pipeline.
+        By default it is appended; use `before`/`after` with a rule name to place it.
+        """
+        with self._lock:
+            if any(r.name == rule.name for r in self._rules):
+                raise ValueError(f"Rule '{rule.name}' is already registered.")
+            if before is not None and after is not None:
+                raise ValueError("Specify only one of 'before' or 'after'.")
+            if before is None and after is None:
+                self._rules.append(rule)
+                return rule
+            anchor = before if before is not None else after
+            index = self._index_of(anchor)
+            self._rules.insert(index if before is not None else index + 1, rule)
+            return rule
+
+    def unregister(self, name):
+        """Removes a rule by name."""
+        with self._lock:
+            self._rules.pop(self._index_of(name))
+
+    def _index_of(self, name):
+        for index, rule in enumerate(self._rules):
+            if rule.name == name:
+                return index
+        raise KeyError(f"Rule '{name}' is not registered.")
+
+    def evaluate(self, target, candidate):
+        """
+        Evaluates the rules against a name pair.
+        Returns a tuple: (result_json_string or None, name_of_rule_that_fired or None)
+        """
+        ctx = RuleContext(target, candidate)
+        rules = self._rules  # Snapshot; reorder() swaps the list atomically
+        result, fired = None, None
+        for rule in rules:
+            start = time.perf_counter()
+            result = rule.func(ctx)
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                rule.calls += 1
+                rule.total_time += elapsed
+                if result is not None:
+                    rule.hits += 1
+            if result is not None:
+                fired = rule.name
+                break
+
+        if self.adaptive:
+            with self._lock:
+                self._evaluations += 1
+                should_reorder = self._evaluations % self.reorder_interval == 0
+            if should_reorder:
+                self.reorder()
+        return result, fired
+
+    def reorder(self):
+        """
+        Sorts reorderable rules by expected cost, leaving fixed rules in place.
+        Only contiguous runs of reorderable rules that declare the same outcomes are
+        sorted, so no rule ever moves past a rule with different outcomes.
+        """
+        with self._lock:
+            new_rules = []
+            run = []
+            for rule in self._rules + [None]:
+                if run and (rule is None or not rule.reorderable or rule.outcomes != run[0].outcomes):
+                    new_rules.extend(sorted(run, key=lambda r: r.expected_cost()))
+                    run = []
+                if rule is None:
+                    break
+                if rule.reorderable:
+                    run.append(rule)
+                else:
+                    new_rules.append(rule)
+            self._rules = new_rules
+
+    def stats(self):
+        """Returns per-rule statistics in current execution order."""
+        with self._lock:
+            return [
+                {
+                    "name": r.name,
+                    "calls": r.calls,
+                    "hits": r.hits,
+                    "hit_rate": r.hit_rate,
+                    "avg_time_ms": r.avg_time * 1000,
+                    "cost_us": r.cost,
+                    "expected_cost_us": r.expected_cost() * 1e6,
+                    "reorderable": r.reorderable,
+                }
+                for r in self._rules
+            ]
+
+    def reset_stats(self):
+        """Clears all recorded statistics."""
+        with self._lock:
+            self._evaluations = 0
+            for r in self._rules:
+                r.calls = r.hits = 0
+                r.total_time = 0.0
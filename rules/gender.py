@@ -1,12 +1,19 @@
 """Gender-related name checking utilities."""
 
+# Patronymic particles: "son of" vs. "daughter of"
+MALE_PATRONYMICS = frozenset({'bin', 'ibn', 'ben'})
+FEMALE_PATRONYMICS = frozenset({'bint'})
+
 
 def is_gender_swap(name1, name2):
     """
     Detects potential gender-swapped names by checking for common suffixes.
-    Example: "Maria" vs. "Mario"
+    Example: "Maria" vs. "Mario", "bin" vs. "bint"
     """
     n1, n2 = name1.lower(), name2.lower()
+    if (n1 in MALE_PATRONYMICS and n2 in FEMALE_PATRONYMICS) or \
+       (n1 in FEMALE_PATRONYMICS and n2 in MALE_PATRONYMICS):
+        return True
     # Block cases like Maria vs Mario if the root is the same
     if (n1.endswith('a') and n2.endswith('o')) or (n1.endswith('o') and n2.endswith('a')):
         if n1[:-1] == n2[:-1]:
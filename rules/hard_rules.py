@@ -1,9 +1,11 @@
 """Hard rules for deterministic name matching."""
 import json
-from config.settings import THRESHOLD
-from utils.normalization import normalize, normalize_no_space
+from config.settings import THRESHOLD, ADAPTIVE_RULE_ORDERING, RULE_REORDER_INTERVAL
+from utils.normalization import normalize_no_space
 from utils.phonetic import check_phonetic_with_risk_assessment
+from utils.alignment import aligned_pairs
 from rules.gender import is_gender_swap
+from rules.engine import Rule, RuleEngine, ACCEPT, REJECT
 
 
 def create_match_result(confidence, reasoning):
@@ -20,35 +22,82 @@ def create_match_result(confidence, reasoning):
     return json.dumps(result, ensure_ascii=False)
 
 
-def check_hard_rules(target, candidate):
-    """
-    Applies a set of deterministic rules to quickly filter out non-matches
-    or identify clear matches before calling the LLM.
-    """
-    t_norm = normalize(target)
-    c_norm = normalize(candidate)
-    t_tokens = t_norm.split()
-    c_tokens = c_norm.split()
+def rule_gender_swap(ctx):
+    """Rejects gender-swapped names (e.g., Maria Gonzalez vs. Mario Gonzalez)."""
+    for t_token, c_token in aligned_pairs(ctx.t_norm, ctx.c_norm) or []:
+        if is_gender_swap(t_token, c_token):
+            return create_match_result(20, "Gendered name difference detected. This is a non-match in financial contexts.")
+    return None
+
+
+def _given_name_first(tokens):
+    """Moves the leading surname of a surname-first name to the end (park jiwon -> jiwon park)."""
+    return tokens[1:] + tokens[:1]
 
-    # Rule 0: Check for gender swaps first (e.g., Maria Gonzalez vs. Mario Gonzalez)
-    if len(t_tokens) == len(c_tokens):
-        for t_token, c_token in zip(t_tokens, c_tokens):
-            if is_gender_swap(t_token, c_token):
-                return create_match_result(20, "Gendered name difference detected. This is a non-match in financial contexts.")
 
-    # Rule 1: Exact match after full normalization (case, punctuation, space insensitive)
-    if normalize_no_space(target) == normalize_no_space(candidate):
+def rule_exact_match(ctx):
+    """
+    Accepts an exact match after full normalization (case, punctuation, space insensitive).
+    Names from a surname-first script (e.g., Hangul) also match in given-name-first order.
+    """
+    if normalize_no_space(ctx.target) == normalize_no_space(ctx.candidate):
         return create_match_result(100, "Exact match after case and punctuation normalization.")
+    if (ctx.t_surname_first and _given_name_first(ctx.t_tokens) == ctx.c_tokens) or \
+       (ctx.c_surname_first and _given_name_first(ctx.c_tokens) == ctx.t_tokens):
+        return create_match_result(100, "Exact match once the surname-first name is read in given-name-first order.")
+    return None
+
 
-    # Rule 2: Check for swapped token order (e.g., Ali Hassan vs. Hassan Ali)
-    if set(t_tokens) == set(c_tokens) and t_tokens != c_tokens:
+def rule_token_order_swap(ctx):
+    """
+    Rejects swapped token order (e.g., Ali Hassan vs. Hassan Ali).
+    Skipped for surname-first scripts, where a different order is expected.
+    """
+    if ctx.t_surname_first or ctx.c_surname_first:
+        return None
+    if set(ctx.t_tokens) == set(ctx.c_tokens) and ctx.t_tokens != ctx.c_tokens:
         return create_match_result(30, "Token order swap changes identity. This is a non-match in financial contexts.")
+    return None
 
-    # Rule 3: Check for safe phonetic matches (e.g., Steven/Stephen)
-    phonetic_result = check_phonetic_with_risk_assessment(t_norm, c_norm)
-    if phonetic_result is not None:
-        return phonetic_result
 
-    # If no hard rules apply, proceed to the LLM stage
-    return None
+def rule_phonetic(ctx):
+    """Accepts safe phonetic matches (e.g., Steven/Stephen)."""
+    return check_phonetic_with_risk_assessment(ctx.t_norm, ctx.c_norm)
+
+
+# Default pipeline. Costs are rough per-call timings in microseconds. The two
+# reject rules (gender, order) are adjacent, so they may swap with each other;
+# the accept rules (exact, phonetic) stay fixed after them.
+default_engine = RuleEngine(
+    rules=[
+        Rule('gender_swap', rule_gender_swap, cost=6.0, outcomes=(REJECT,), reorderable=True),
+        Rule('token_order_swap', rule_token_order_swap, cost=2.0, outcomes=(REJECT,), reorderable=True),
+        Rule('exact_match', rule_exact_match, cost=8.0, outcomes=(ACCEPT,), reorderable=False),
+        Rule('phonetic', rule_phonetic, cost=10.0, outcomes=(ACCEPT,), reorderable=False),
+    ],
+    adaptive=ADAPTIVE_RULE_ORDERING,
+    reorder_interval=RULE_REORDER_INTERVAL,
+)
+
+
+def register_rule(name, func, cost=5.0, outcomes=(ACCEPT, REJECT), reorderable=False, before=None, after=None):
+    """
+    Registers a site-specific rule on the default engine without editing this module.
+    - func: Called with a RuleContext; returns a result from create_match_result() or None.
+    - cost: Estimated execution time in microseconds.
+    - outcomes/reorderable: See Rule; a reorderable rule only swaps with adjacent rules of the same outcomes.
+    - before/after: Name of an existing rule to place this one next to (default: last).
+    """
+    rule = Rule(name, func, cost=cost, outcomes=outcomes, reorderable=reorderable)
+    return default_engine.register(rule, before=before, after=after)
+
 
+def check_hard_rules(target, candidate):
+    """
+    Applies a set of deterministic rules to quickly filter out non-matches
+    or identify clear matches before calling the LLM.
+    """
+    result, _ = default_engine.evaluate(target, candidate)
+
+    # If no hard rules apply, proceed to the LLM stage
+    return result
@@ -32,4 +32,11 @@ TEST_CASES = [
     ("Ivan Petrov", "Ilya Petrov", False, "Distinct given names in same cultural group"),
     ("Fatima Zahra", "Zahra Fatima", False, "Name order inversion changes identity"),
     ("William Carter", "Liam Carter", False, "Nickname not universally equivalent without explicit mapping"),
+
+    # Particle alignment regressions (31-35): a shared particle must not be merged or dropped
+    ("Wei Al Saud", "Julia Al Saud", False, "Different given names sharing an Al- surname"),
+    ("Chiara Al Saud", "Carlo Al Saud", False, "Gendered given names sharing an Al- surname"),
+    ("Dana Al Saud", "Danielle Al Saud", False, "Distinct given names sharing an Al- surname"),
+    ("Nadia Al Saud", "Natalia Al Saud", False, "Similar-sounding but distinct given names"),
+    ("Layla Al Saud", "Laya Al Saud", True, "Typo in a short given name"),
 ]
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""Token alignment for names with differing token counts."""
+from functools import lru_cache
+from metaphone import doublemetaphone
+
+# Connecting particles that may be omitted in one spelling of a name
+# (e.g., "Omar ibn Al Khattab" vs. "Omar Ibn Alkhattab", "Ludwig van Beethoven").
+NAME_PARTICLES = frozenset({
+    'al', 'el', 'ibn', 'bin', 'bint', 'ben',
+    'de', 'del', 'della', 'da', 'di', 'du', 'dos', 'das',
+    'van', 'von', 'der', 'den', 'la', 'le',
+})
+
+# Maximum number of adjacent tokens merged into one (e.g., "abdul rahman" -> "abdulrahman")
+MAX_MERGE = 3
+
+# Alignment step costs. Lower is better; exact pairs are free.
+EXACT_COST = 0
+PHONETIC_COST = 1
+MISMATCH_COST = 4
+MERGE_COST = 0.5
+DROP_COST = 1.5
+
+
+@lru_cache(maxsize=4096)
+def phonetic_codes(token):
+    """Returns the non-empty Double Metaphone codes for a token as a set."""
+    return frozenset(doublemetaphone(token)) - {''}
+
+
+def sounds_alike(token1, token2):
+    """Checks whether two tokens share at least one Double Metaphone code."""
+    return bool(phonetic_codes(token1) & phonetic_codes(token2))
+
+
+def _particles_spelled_out(merged_tokens, other_chunk):
+    """
+    Checks that particles inside a merged chunk are kept literally by the other side.
+    A particle may only lead the merge (e.g., "al fayed" vs. "alfayed"); merging one into
+    a neighbouring name ("chiara al" vs. "carlo") would hide the real difference.
+    """
+    if any(token in NAME_PARTICLES for token in merged_tokens[1:]):
+        return False
+    return merged_tokens[0] not in NAME_PARTICLES or other_chunk.startswith(merged_tokens[0])
+
+
+def _pair_cost(t_chunk, c_chunk, merged):
+    """
+    Returns the cost of aligning two chunks, or None if they cannot be aligned.
+    - One-to-one pairs can always be aligned (mismatches are left for the rules to judge).
+    - Merged pairs are only allowed when the joined tokens match or sound alike.
+    """
+    if t_chunk == c_chunk:
+        return MERGE_COST if merged else EXACT_COST
+    if sounds_alike(t_chunk, c_chunk):
+        return PHONETIC_COST + (MERGE_COST if merged else 0)
+    if merged:
+        return None
+    return MISMATCH_COST
+
+
+def align_tokens(t_tokens, c_tokens):
+    """
+    Finds the lowest-cost monotonic alignment between two token lists.
+
+    Allowed steps:
+    - Pair one target token with one candidate token
+    - Merge up to MAX_MERGE adjacent tokens on one side (compound names, e.g. "Al Fayed" vs. "Alfayed")
+    - Drop a particle from either side (e.g., "ibn", "van")
+
+    Particle drops are restricted so they cannot hide a real difference:
+    - The first token is never dropped ("Ben", "Van", "Le" and "Da" are also given names)
+    - Only one side may drop particles, so "de" vs. "van" or "bin" vs. "bint"
+      are paired and judged by the rules instead of both disappearing
+    - A particle is not dropped while the other side still has it to pair with
+    - A particle is only merged as the leading part of a compound that the other
+      side spells out (see _particles_spelled_out)
+
+    Returns a list of (target_chunk, candidate_chunk) pairs, where merged tokens are
+    joined without spaces and a dropped particle is paired with None.
+    Returns None if no alignment exists.
+    """
+    n, m = len(t_tokens), len(c_tokens)
+    inf = float('inf')
+    # State: which side has dropped particles so far
+    no_drop, t_dropped, c_dropped = 0, 1, 2
+    cost = [[[inf] * (m + 1) for _ in range(n + 1)] for _ in range(3)]
+    back = [[[None] * (m + 1) for _ in range(n + 1)] for _ in range(3)]
+    cost[no_drop][0][0] = 0
+
+    def relax(state, i, j, new_state, di, dj, step_cost, pair):
+        new_cost = cost[state][i][j] + step_cost
+        # Strict comparison keeps the first (simplest) step on ties
+        if new_cost < cost[new_state][i + di][j + dj]:
+            cost[new_state][i + di][j + dj] = new_cost
+            back[new_state][i + di][j + dj] = (state, i, j, pair)
+
+    for i in range(n + 1):
+        for j in range(m + 1):
+            for state in (no_drop, t_dropped, c_dropped):
+                if cost[state][i][j] == inf:
+                    continue
+
+                # One-to-one and merge steps (only one side is merged at a time)
+                if i < n and j < m:
+                    for di in range(1, min(MAX_MERGE, n - i) + 1):
+                        for dj in range(1, min(MAX_MERGE, m - j) + 1):
+                            if di > 1 and dj > 1:
+                                continue
+                            t_chunk = ''.join(t_tokens[i:i + di])
+                            c_chunk = ''.join(c_tokens[j:j + dj])
+                            if di > 1 and not _particles_spelled_out(t_tokens[i:i + di], c_chunk):
+                                continue
+                            if dj > 1 and not _particles_spelled_out(c_tokens[j:j + dj], t_chunk):
+                                continue
+                            step_cost = _pair_cost(t_chunk, c_chunk, merged=(di > 1 or dj > 1))
+                            if step_cost is not None:
+                                relax(state, i, j, state, di, dj, step_cost, (t_chunk, c_chunk))
+
+                # Particle drops
+                if 0 < i < n and state != c_dropped and t_tokens[i] in NAME_PARTICLES \
+                        and t_tokens[i] not in c_tokens[j:]:
+                    relax(state, i, j, t_dropped, 1, 0, DROP_COST, (t_tokens[i], None))
+                if 0 < j < m and state != t_dropped and c_tokens[j] in NAME_PARTICLES \
+                        and c_tokens[j] not in t_tokens[i:]:
+                    relax(state, i, j, c_dropped, 0, 1, DROP_COST, (None, c_tokens[j]))
+
+    state = min((no_drop, t_dropped, c_dropped), key=lambda s: cost[s][n][m])
+    if cost[state][n][m] == inf:
+        return None
+
+    pairs = []
+    i, j = n, m
+    while (i, j) != (0, 0):
+        state, i, j, pair = back[state][i][j]
+        pairs.append(pair)
+    pairs.reverse()
+    return pairs
+
+
+@lru_cache(maxsize=4096)
+def align_names(t_norm, c_norm):
+    """
+    Aligns two normalized names token by token.
+    Results are cached since the hard rules and the phonetic stage align the same pair.
+    """
+    pairs = align_tokens(t_norm.split(), c_norm.split())
+    return tuple(pairs) if pairs is not None else None
+
+
+def aligned_pairs(t_norm, c_norm):
+    """
+    Returns only the matched (non-dropped) pairs of the alignment, or None if the
+    names cannot be aligned or no tokens were paired.
+    Names with the same token count are paired one-to-one, as before alignment existed;
+    the aligner only handles differing token counts.
+    """
+    t_tokens = t_norm.split()
+    c_tokens = c_norm.split()
+    if len(t_tokens) == len(c_tokens):
+        return list(zip(t_tokens, c_tokens)) or None
+    pairs = align_names(t_norm, c_norm)
+    if pairs is None:
+        return None
+    matched = [(t, c) for t, c in pairs if t is not None and c is not None]
+    return matched or None
@@ -1,12 +1,14 @@
 """Name normalization utilities."""
 import re
 import unicodedata
+from utils.transliteration import transliterate
 
 
 def normalize(name):
     """
     Normalizes a name for consistent comparison.
     - Converts to lowercase
+    - Romanizes Cyrillic, Greek, Arabic and Hangul script (e.g., "Горбачёв" -> "gorbachev")
     - Removes accents and diacritics
     - Replaces hyphens with spaces
     - Removes apostrophes and periods
@@ -17,6 +19,10 @@ def normalize(name):
         return ""
 
     clean = name.lower()
+    # Compose first so decomposed input (e.g., "и" + combining breve) romanizes like "й"
+    clean = unicodedata.normalize('NFC', clean)
+    # Romanize before NFKD, which would otherwise split Hangul syllables into jamo
+    clean = transliterate(clean)
     # Normalize unicode characters to remove accents (e.g., "José" -> "Jose")
     clean = unicodedata.normalize('NFKD', clean)
     clean = ''.join([c for c in clean if not unicodedata.combining(c)])
@@ -1,38 +1,29 @@
 """Phonetic matching utilities."""
-from metaphone import doublemetaphone
 from utils.normalization import normalize
+from utils.alignment import aligned_pairs, sounds_alike
 from rules.gender import is_gender_swap
 
 
 def check_phonetic_with_risk_assessment(t_norm, c_norm):
     """
     Checks for phonetic similarity using Double Metaphone and assesses risk factors.
+    Tokens are first aligned (merges, particle drops), so names with differing
+    token counts (e.g., "Mohammed Al Fayed" vs. "Muhammad Alfayed") can still match.
 
     Returns:
     - A high-confidence match result if names are phonetically similar and low-risk.
     - None if names are not phonetically similar or are high-risk, deferring to the LLM.
     """
-    t_tokens = t_norm.split()
-    c_tokens = c_norm.split()
-
-    if len(t_tokens) != len(c_tokens):
+    pairs = aligned_pairs(t_norm, c_norm)
+    if pairs is None:
         return None
 
     # 1. First, check for phonetic similarity as a baseline.
-    phonetic_match = True
-    for t1, t2 in zip(t_tokens, c_tokens):
-        code1 = doublemetaphone(t1)
-        code2 = doublemetaphone(t2)
-        # Check for any intersection between the two sets of phonetic codes
-        if not (set(code1) & set(code2) - {''}):
-            phonetic_match = False
-            break
-
-    if not phonetic_match:
+    if not all(sounds_alike(t1, t2) for t1, t2 in pairs):
         return None
 
     # 2. [Core Logic] If phonetically similar, check for 'risky' differences.
-    for t_token, c_token in zip(t_tokens, c_tokens):
+    for t_token, c_token in pairs:
         if t_token == c_token:
             continue
 
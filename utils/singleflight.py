@@ -0,0 +1,110 @@
+"""Single-flight coalescing of identical in-flight calls."""
+import asyncio
+import threading
+from concurrent.futures import Future
+from utils.normalization import normalize
+
+
+def verification_key(target, candidate, algorithm, phonetic_hint=False):
+    """Builds the coalescing key for an LLM verification of a name pair."""
+    return (normalize(target), normalize(candidate), algorithm, bool(phonetic_hint))
+
+
+class SingleFlight:
+    """
+    Ensures that only one call per key is in flight at a time.
+
+    The first caller for a key (the leader) runs the function; concurrent callers
+    with the same key wait for it and share its result or exception. Nothing is
+    cached: once the call completes, the next caller starts a new one.
+
+    Thread and asyncio callers can be mixed, since both wait on the same
+    concurrent.futures.Future. Cancelling an asyncio waiter only detaches that
+    waiter; the shared call keeps running for everyone else.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def _join(self, key):
+        """Returns (future, is_leader) for the key, creating the flight if needed."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.followers += 1
+                return future, False
+            future = Future()
+            # Mark as running so a cancelled waiter cannot cancel the shared call
+            future.set_running_or_notify_cancel()
+            self._calls[key] = future
+            self.leaders += 1
+            return future, True
+
+    def _finish(self, key, future, result=None, exception=None):
+        with self._lock:
+            self._calls.pop(key, None)
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    def _run(self, key, future, fn, args, kwargs):
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key, future, exception=e)
+            raise
+        self._finish(key, future, result=result)
+        return result
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Calls fn(*args, **kwargs) unless an identical call is already in flight,
+        in which case waits for it and returns its result (or raises its exception).
+        """
+        future, is_leader = self._join(key)
+        if is_leader:
+            return self._run(key, future, fn, args, kwargs)
+        return future.result()
+
+    async def do_async(self, key, fn, *args, executor=None, **kwargs):
+        """
+        Asyncio variant of do().
+        A coroutine function runs as a task on the running loop; a regular function
+        runs in `executor` (the loop's default executor if None).
+        """
+        future, is_leader = self._join(key)
+        if is_leader:
+            loop = asyncio.get_running_loop()
+            if asyncio.iscoroutinefunction(fn):
+                loop.create_task(self._run_coroutine(key, future, fn, args, kwargs))
+            else:
+                loop.run_in_executor(executor, self._run_quietly, key, future, fn, args, kwargs)
+        return await asyncio.wrap_future(future)
+
+    async def _run_coroutine(self, key, future, fn, args, kwargs):
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key, future, exception=e)
+            return
+        self._finish(key, future, result=result)
+
+    def _run_quietly(self, key, future, fn, args, kwargs):
+        # Exceptions are delivered through the shared future
+        try:
+            self._run(key, future, fn, args, kwargs)
+        except BaseException:
+            pass
+
+    def in_flight(self):
+        """Returns the number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+
+# Shared instance for LLM verification calls
+llm_flight = SingleFlight()
@@ -0,0 +1,229 @@
+"""Script-aware romanization of non-Latin names."""
+import re
+import unicodedata
+from functools import lru_cache
+
+# Cyrillic (Russian, plus Ukrainian/Serbian letters), close to passport (ICAO) practice.
+# "ё" maps to "e" as in most official documents (Горбачёв -> gorbachev), and
+# "ия" to "ia" as in the usual spelling of names (Мария -> maria, not mariya).
+CYRILLIC = {
+    'ия': 'ia',
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'ж': 'zh',
+    'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o',
+    'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts',
+    'ч': 'ch', 'ш': 'sh', 'щ': 'shch', 'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu',
+    'я': 'ya', 'і': 'i', 'ї': 'yi', 'є': 'ye', 'ґ': 'g', 'ў': 'u', 'ђ': 'dj', 'ј': 'j',
+    'љ': 'lj', 'њ': 'nj', 'ћ': 'c', 'џ': 'dz', 'ѓ': 'gj', 'ќ': 'kj', 'ѕ': 'dz',
+}
+
+# Greek (ELOT 743). Digraphs are listed so the longest match wins.
+GREEK = {
+    'ου': 'ou', 'αυ': 'av', 'ευ': 'ev', 'ηυ': 'iv', 'γγ': 'ng', 'γκ': 'gk', 'γξ': 'nx', 'γχ': 'nch',
+    'α': 'a', 'β': 'v', 'γ': 'g', 'δ': 'd', 'ε': 'e', 'ζ': 'z', 'η': 'i', 'θ': 'th',
+    'ι': 'i', 'κ': 'k', 'λ': 'l', 'μ': 'm', 'ν': 'n', 'ξ': 'x', 'ο': 'o', 'π': 'p',
+    'ρ': 'r', 'σ': 's', 'ς': 's', 'τ': 't', 'υ': 'y', 'φ': 'f', 'χ': 'ch', 'ψ': 'ps',
+    'ω': 'o',
+}
+
+# Arabic and Persian letters. Short vowels are usually unwritten, so most names
+# romanize to a consonant skeleton, which is what Double Metaphone compares anyway.
+# Waw, yeh, ain and shadda depend on context and are handled in _romanize_arabic_letters.
+ARABIC = {
+    'ا': 'a', 'أ': 'a', 'إ': 'i', 'آ': 'a', 'ٱ': 'a', 'ب': 'b', 'ت': 't', 'ث': 'th',
+    'ج': 'j', 'ح': 'h', 'خ': 'kh', 'د': 'd', 'ذ': 'dh', 'ر': 'r', 'ز': 'z', 'س': 's',
+    'ش': 'sh', 'ص': 's', 'ض': 'd', 'ط': 't', 'ظ': 'z', 'غ': 'gh', 'ف': 'f', 'ق': 'q',
+    'ك': 'k', 'ل': 'l', 'م': 'm', 'ن': 'n', 'ه': 'h', 'ة': 'a', 'ى': 'a', 'ء': '',
+    'ؤ': '', 'ئ': '', 'پ': 'p', 'چ': 'ch', 'ژ': 'zh', 'گ': 'g', 'ک': 'k',
+    # Harakat (short vowel marks), when present
+    'َ': 'a', 'ِ': 'i', 'ُ': 'u', 'ْ': '', 'ً': 'an', 'ٍ': 'in', 'ٌ': 'un', 'ـ': '',
+}
+
+# Conventional spellings of common unvocalized Arabic names and particles.
+# Without written short vowels the letter-by-letter skeleton (محمد -> mhmd) loses
+# sounds that Double Metaphone relies on, so common names are looked up whole.
+ARABIC_NAMES = {
+    'محمد': 'muhammad', 'أحمد': 'ahmad', 'احمد': 'ahmad', 'محمود': 'mahmoud', 'مصطفى': 'mustafa',
+    'علي': 'ali', 'عمر': 'omar', 'عثمان': 'uthman', 'حسن': 'hassan', 'حسين': 'hussein',
+    'يوسف': 'yusuf', 'إبراهيم': 'ibrahim', 'ابراهيم': 'ibrahim', 'خالد': 'khalid',
+    'عبد': 'abd', 'الله': 'allah', 'اللّه': 'allah', 'عبدالله': 'abdullah', 'عبدالرحمن': 'abdulrahman', 'فاطمة': 'fatima',
+    'عائشة': 'aisha', 'مريم': 'maryam', 'زينب': 'zainab', 'سعيد': 'saeed', 'سالم': 'salem',
+    'صالح': 'saleh', 'كريم': 'karim', 'طارق': 'tariq', 'سمير': 'samir', 'ياسر': 'yasser',
+    'نور': 'noor', 'ليلى': 'layla', 'هدى': 'huda', 'سلمى': 'salma', 'زهرة': 'zahra',
+    'رشيد': 'rashid', 'قاسم': 'qasim', 'فايد': 'fayed', 'سعود': 'saud', 'خطاب': 'khattab',
+    'هلال': 'hilal', 'حداد': 'haddad', 'ناصر': 'nasser', 'خليل': 'khalil', 'منصور': 'mansour',
+    'ابن': 'ibn', 'بن': 'bin', 'بنت': 'bint', 'أبو': 'abu', 'ابو': 'abu',
+}
+_ARABIC_ARTICLE = 'ال'
+_ARABIC_WAW = 'و'
+_ARABIC_YEH = ('ي', 'ی')
+_ARABIC_AIN = 'ع'
+_ARABIC_SHADDA = 'ّ'
+_ARABIC_VOWEL_UNITS = {'a', 'i', 'u', 'an', 'in', 'un'}
+
+# Hangul (Revised Romanization). Syllables decompose arithmetically into
+# initial (L), vowel (V) and final (T) jamo.
+_HANGUL_L = ['g', 'kk', 'n', 'd', 'tt', 'r', 'm', 'b', 'pp', 's', 'ss', '', 'j', 'jj',
+             'ch', 'k', 't', 'p', 'h']
+_HANGUL_V = ['a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa', 'wae', 'oe', 'yo',
+             'u', 'wo', 'we', 'wi', 'yu', 'eu', 'ui', 'i']
+_HANGUL_T = ['', 'k', 'k', 'k', 'n', 'n', 'n', 't', 'l', 'k', 'm', 'l', 'l', 'l', 'p', 'l',
+             'm', 'p', 'p', 't', 't', 'ng', 't', 't', 'k', 't', 'p', 't']
+_HANGUL_BASE = 0xAC00
+HANGUL = {
+    chr(_HANGUL_BASE + index): _HANGUL_L[index // 588] + _HANGUL_V[(index % 588) // 28] + _HANGUL_T[index % 28]
+    for index in range(19 * 21 * 28)
+}
+
+# Conventional spellings of common Korean surnames (박 -> park, not bak)
+HANGUL_SURNAMES = {
+    '김': 'kim', '이': 'lee', '박': 'park', '최': 'choi', '정': 'jung', '강': 'kang',
+    '조': 'cho', '윤': 'yoon', '장': 'jang', '임': 'lim', '한': 'han', '오': 'oh',
+    '서': 'seo', '신': 'shin', '권': 'kwon', '황': 'hwang', '안': 'ahn', '송': 'song',
+    '류': 'ryu', '홍': 'hong', '노': 'noh', '문': 'moon', '유': 'yoo', '전': 'jeon',
+}
+
+_SCRIPT_RANGES = [
+    ('cyrillic', 0x0400, 0x052F),
+    ('greek', 0x0370, 0x03FF),
+    ('greek', 0x1F00, 0x1FFF),
+    ('arabic', 0x0600, 0x06FF),
+    ('arabic', 0x0750, 0x077F),
+    ('hangul', 0xAC00, 0xD7A3),
+]
+
+# Scripts whose names are conventionally written surname first (박지원 -> Park Jiwon)
+SURNAME_FIRST_SCRIPTS = frozenset({'hangul'})
+
+_CYRILLIC_KEY_LENGTH = max(len(key) for key in CYRILLIC)
+_GREEK_KEY_LENGTH = max(len(key) for key in GREEK)
+
+
+def detect_script(char):
+    """Returns the script of a character: 'cyrillic', 'greek', 'arabic', 'hangul' or None."""
+    code = ord(char)
+    for script, start, end in _SCRIPT_RANGES:
+        if start <= code <= end:
+            return script
+    return None
+
+
+def is_surname_first(text):
+    """Checks whether a name is written in a surname-first script (e.g., Hangul)."""
+    return any(detect_script(char) in SURNAME_FIRST_SCRIPTS for char in text)
+
+
+def _base_char(char):
+    """Strips accents from a single character (e.g., Greek 'ώ' -> 'ω')."""
+    return unicodedata.normalize('NFD', char)[0]
+
+
+def _romanize_table(run, table, max_key=1):
+    out = []
+    i = 0
+    while i < len(run):
+        for size in range(min(max_key, len(run) - i), 0, -1):
+            piece = run[i:i + size]
+            if piece in table:
+                out.append(table[piece])
+                i += size
+                break
+            base = ''.join(_base_char(c) for c in piece)
+            if base in table:
+                out.append(table[base])
+                i += size
+                break
+        else:
+            # Combining marks (Greek tonos etc.) carry no sound of their own
+            if not unicodedata.combining(run[i]):
+                out.append(run[i])
+            i += 1
+    return ''.join(out)
+
+
+def _romanize_arabic(run):
+    if run in ARABIC_NAMES:
+        return ARABIC_NAMES[run]
+    # Definite article prefix (الرشيد -> alrashid)
+    if run.startswith(_ARABIC_ARTICLE) and len(run) > len(_ARABIC_ARTICLE):
+        return 'al' + _romanize_arabic(run[len(_ARABIC_ARTICLE):])
+    return _romanize_arabic_letters(run)
+
+
+def _romanize_arabic_letters(run):
+    out = []
+    for char in run:
+        at_start = not out
+        previous = out[-1][-1:] if out else ''
+        if char == _ARABIC_WAW:
+            out.append('w' if at_start or previous in 'aiu' else 'u')
+        elif char in _ARABIC_YEH:
+            out.append('y' if at_start or previous in 'aiu' else 'i')
+        elif char == _ARABIC_AIN:
+            out.append('a' if at_start else '')
+        elif char == _ARABIC_SHADDA:
+            # Shadda doubles the preceding consonant; a vowel mark may be written before it
+            for index in range(len(out) - 1, -1, -1):
+                if out[index] and out[index] not in _ARABIC_VOWEL_UNITS:
+                    out.insert(index + 1, out[index][-1])
+                    break
+        else:
+            out.append(ARABIC.get(char, char if not unicodedata.combining(char) else ''))
+    return ''.join(out)
+
+
+def _romanize_hangul(run):
+    if len(run) in (1, 3) and run[0] in HANGUL_SURNAMES:
+        # A lone syllable or a 3-syllable full name usually starts with the surname
+        return HANGUL_SURNAMES[run[0]] + ''.join(HANGUL.get(c, c) for c in run[1:])
+    return ''.join(HANGUL.get(c, c) for c in run)
+
+
+def _romanize_run(script, run):
+    if script == 'cyrillic':
+        return _romanize_table(run, CYRILLIC, _CYRILLIC_KEY_LENGTH)
+    if script == 'greek':
+        return _romanize_table(run, GREEK, _GREEK_KEY_LENGTH)
+    if script == 'arabic':
+        return _romanize_arabic(run)
+    if script == 'hangul':
+        return _romanize_hangul(run)
+    return run
+
+
+@lru_cache(maxsize=65536)
+def transliterate_token(token):
+    """
+    Romanizes a single lowercase token. Characters are grouped into runs of the
+    same script so mixed-script tokens (e.g., Latin names with Cyrillic look-alikes)
+    are handled too. Latin and unknown characters pass through unchanged.
+    """
+    if token.isascii():
+        return token
+    out = []
+    run, run_script = '', None
+    for char in token:
+        script = detect_script(char)
+        # Combining marks stay attached to the current run
+        if script is None and run_script is not None and unicodedata.combining(char):
+            script = run_script
+        if script != run_script and run:
+            out.append(_romanize_run(run_script, run))
+            run = ''
+        run += char
+        run_script = script
+    if run:
+        out.append(_romanize_run(run_script, run))
+    return ''.join(out)
+
+
+_TOKEN_PATTERN = re.compile(r'\S+')
+
+
+def transliterate(text):
+    """
+    Romanizes Cyrillic, Greek, Arabic and Hangul text token by token.
+    Expects lowercase input; results are cached per token.
+    """
+    if text.isascii():
+        return text
+    return _TOKEN_PATTERN.sub(lambda m: transliterate_token(m.group()), text)
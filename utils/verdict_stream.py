@@ -0,0 +1,127 @@
+"""Incremental parsing of streamed JSON verdicts."""
+import json
+import re
+import threading
+
+_MATCH_PATTERN = re.compile(r'"match"\s*:\s*(true|false)', re.IGNORECASE)
+# The lookahead ensures the number is complete before it is accepted
+_CONFIDENCE_PATTERN = re.compile(r'"confidence"\s*:\s*"?(\d+(?:\.\d+)?)"?(?=\s*[,}\n])')
+_EXPLANATION_PATTERN = re.compile(r'"explanation"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL)
+
+
+def _strip_code_fence(text):
+    """Removes a surrounding markdown ```json fence, if present."""
+    text = text.strip()
+    if text.startswith('```'):
+        text = re.sub(r'^```(?:json)?\s*', '', text)
+        text = re.sub(r'\s*```$', '', text)
+    return text
+
+
+class StreamedVerdict:
+    """
+    A verdict read from a stream of text chunks.
+
+    Reading stops as soon as "match" and "confidence" are decoded, so the decision
+    is available before the model finishes writing its explanation. The explanation
+    is read lazily on first access, or never if the stream is closed first.
+    Each verdict wraps one stream and belongs to one caller: close() ends the stream
+    for every holder, so do not hand the same instance to independent callers.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._lock = threading.Lock()
+        self._buffer = ''
+        self._scan_from = 0
+        self._finished = False
+        self.match = None
+        self.confidence = None
+        self._explanation = None
+        self._read_verdict()
+
+    @classmethod
+    def from_text(cls, text):
+        """Wraps a complete response (e.g., a hard-rule result) in a fully read verdict."""
+        verdict = cls([text])
+        if not verdict.complete:
+            verdict._finish()
+        return verdict
+
+    def _feed(self, chunk):
+        self._buffer += chunk
+        # Patterns are short, so only rescan a small tail of already-seen text
+        window = self._buffer[max(self._scan_from - 64, 0):]
+        if self.match is None:
+            found = _MATCH_PATTERN.search(window)
+            if found:
+                self.match = found.group(1).lower() == 'true'
+        if self.confidence is None:
+            found = _CONFIDENCE_PATTERN.search(window)
+            if found:
+                value = float(found.group(1))
+                self.confidence = int(value) if value.is_integer() else value
+        self._scan_from = len(self._buffer)
+
+    def _read_verdict(self):
+        for chunk in self._chunks:
+            self._feed(chunk)
+            if self.match is not None and self.confidence is not None:
+                return
+        self._finish()
+
+    def _finish(self):
+        """Marks the stream as fully read and parses whatever was not decoded yet."""
+        self._finished = True
+        try:
+            parsed = json.loads(_strip_code_fence(self._buffer))
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, dict):
+            if self.match is None and isinstance(parsed.get('match'), bool):
+                self.match = parsed['match']
+            if self.confidence is None:
+                self.confidence = parsed.get('confidence')
+            if isinstance(parsed.get('explanation'), str):
+                self._explanation = parsed['explanation']
+                return
+        found = _EXPLANATION_PATTERN.search(self._buffer)
+        if found:
+            self._explanation = json.loads(f'"{found.group(1)}"')
+
+    @property
+    def complete(self):
+        """True once the full response has been read (or the stream was closed)."""
+        return self._finished
+
+    @property
+    def explanation(self):
+        """Reads the rest of the stream on first access. Empty if the stream was closed early."""
+        with self._lock:
+            if not self._finished:
+                for chunk in self._chunks:
+                    self._buffer += chunk
+                self._finish()
+            return self._explanation or ''
+
+    @property
+    def raw_text(self):
+        return self._buffer
+
+    def close(self):
+        """Stops reading and releases the underlying stream without waiting for the explanation."""
+        with self._lock:
+            if not self._finished:
+                # Closing a generator runs its cleanup, which closes the HTTP stream
+                close = getattr(self._chunks, 'close', None)
+                if close is not None:
+                    close()
+                self._finished = True
+
+    def to_json(self):
+        """Formats the verdict like the non-streaming verifiers. Reads the explanation if still open."""
+        return json.dumps({
+            "match": self.match,
+            "confidence": self.confidence,
+            "explanation": self.explanation
+        }, ensure_ascii=False)